@@ -12,6 +12,12 @@ TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 TG_BOT_TOKEN = os.getenv("TG_BOT_TOKEN")
 TG_CHAT_ID = os.getenv("TG_CHAT_ID")
 
+# --- 流式推送配置 (GitHub Variables) ---
+# 开启后 LLM 以流式输出，每生成完一个章节即推送/编辑 Telegram 消息
+LLM_STREAM = os.getenv("LLM_STREAM", "false").strip().lower() in ("1", "true", "yes")
+# 同一条消息两次编辑的最小间隔(秒)，避免触发 Telegram 编辑限流
+TG_EDIT_INTERVAL = float(os.getenv("TG_EDIT_INTERVAL") or 3)
+
 # --- 基金列表 (GitHub Variables) ---
 # 格式: "112233,445566" (逗号分隔)
 etf_str = os.getenv("ETF_LIST", "")
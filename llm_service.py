@@ -10,10 +10,7 @@ class LLMService:
             self.client = OpenAI(api_key=LLM_API_KEY, base_url=LLM_BASE_URL)
             print(f"[OK] [LLM] 初始化成功，使用模型: {LLM_MODEL}")
 
-    def generate_report(self, info, metrics, news):
-        if not self.client:
-            return "⚠️ API Key 未配置"
-
+    def _build_messages(self, info, metrics, news):
         system_prompt = """
         你是一位拥有15年经验的资深基金分析师，擅长基本面归因与量化择时。
         请基于提供的数据，写一份深度分析研报。拒绝模棱两可的废话，必须有逻辑推导。
@@ -85,17 +82,27 @@ class LLMService:
         {news}
         """
 
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content}
+        ]
+
+    def _log_inputs(self, info, metrics):
         print(f"  [LLM] 正在为 {info['name']} 生成分析报告...")
         print(f"  [LLM] 输入预览: 价格={metrics['price']}, 趋势={metrics['trend']}")
         print(f"  [LLM] 夏普={metrics['sharpe']}, 位置={metrics['rank']}%, 重仓股数={len(info['top_holdings'])}")
 
+    def generate_report(self, info, metrics, news):
+        if not self.client:
+            return "⚠️ API Key 未配置"
+
+        messages = self._build_messages(info, metrics, news)
+        self._log_inputs(info, metrics)
+
         try:
             resp = self.client.chat.completions.create(
                 model=LLM_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_content}
-                ],
+                messages=messages,
                 temperature=0.7
             )
             report = resp.choices[0].message.content
@@ -105,3 +112,72 @@ class LLMService:
         except Exception as e:
             print(f"  [ERROR] [LLM] {info['name']} 调用失败: {e}")
             return f"LLM 调用出错: {e}"
+
+    def generate_report_stream(self, info, metrics, news, on_section):
+        """
+        流式生成报告，每完成一个 "## " 章节即回调 on_section(章节文本)
+
+        Returns:
+            str: 完整报告；出错时返回与 generate_report 相同格式的错误信息
+        """
+        if not self.client:
+            # 与非流式模式保持一致：提示信息同样推送出去
+            on_section("⚠️ API Key 未配置")
+            return "⚠️ API Key 未配置"
+
+        messages = self._build_messages(info, metrics, news)
+        self._log_inputs(info, metrics)
+
+        parts = []
+        buffer = ""
+        section_count = 0
+        try:
+            stream = self.client.chat.completions.create(
+                model=LLM_MODEL,
+                messages=messages,
+                temperature=0.7,
+                stream=True
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                buffer += delta
+                sections, buffer = _split_sections(buffer)
+                for section in sections:
+                    section_count += 1
+                    on_section(section)
+
+            tail = buffer.strip()
+            if tail:
+                section_count += 1
+                on_section(tail)
+
+            report = "".join(parts)
+            print(f"  [OK] [LLM] {info['name']} 流式报告生成成功 ({len(report)} 字符, {section_count} 个章节)")
+            return report
+        except Exception as e:
+            print(f"  [ERROR] [LLM] {info['name']} 流式调用失败: {e}")
+            return f"LLM 调用出错: {e}"
+
+
+def _split_sections(buffer):
+    """
+    从缓冲区中切出已完整的章节(以下一个 "## " 标题出现为准)
+
+    Returns:
+        tuple: (已完成章节列表, 剩余未完成的缓冲区)
+    """
+    sections = []
+    while True:
+        idx = buffer.find("\n## ")
+        if idx == -1:
+            break
+        section = buffer[:idx].strip()
+        if section:
+            sections.append(section)
+        buffer = buffer[idx + 1:]
+    return sections, buffer
@@ -1,7 +1,7 @@
 import time
 import sys
 from datetime import datetime
-from config import ETF_LIST, MUTUAL_LIST, TG_BOT_TOKEN, TG_CHAT_ID
+from config import ETF_LIST, MUTUAL_LIST, TG_BOT_TOKEN, TG_CHAT_ID, LLM_STREAM, TG_EDIT_INTERVAL
 from data_fetcher import DataFetcher
 from news_fetcher import NewsFetcher
 from analyzer import Analyzer
@@ -81,17 +81,24 @@ def main():
                 info['top_holdings']
             )
 
-            log(f"E. 生成报告...")
             full_news = f"{macro_news}\n{specific_news}"
-            report = ai.generate_report(info, met, full_news)
+            if LLM_STREAM:
+                log(f"E/F. 流式生成并推送报告...")
+                stream = tg.start_stream(info['name'], edit_interval=TG_EDIT_INTERVAL)
+                report = ai.generate_report_stream(info, met, full_news, on_section=stream.push)
+                stream.finish(error=bool(report and "LLM 调用出错" in report))
+            else:
+                log(f"E. 生成报告...")
+                report = ai.generate_report(info, met, full_news)
 
             if report and "LLM 调用出错" in report:
                 log(f"LLM 生成失败: {report}", "ERROR")
                 fail_count += 1
                 continue
 
-            log(f"F. 推送报告...")
-            tg.send_report(info['name'], report)
+            if not LLM_STREAM:
+                log(f"F. 推送报告...")
+                tg.send_report(info['name'], report)
 
             success_count += 1
             log(f"完成分析: {info['name']}", "SUCCESS")
@@ -1,3 +1,4 @@
+import time
 import requests
 
 class TelegramBot:
@@ -36,3 +37,157 @@ class TelegramBot:
                 print(f"  [ERROR] [Telegram] {fund_name} 推送失败: HTTP {resp.status_code}")
         except Exception as e:
             print(f"  [ERROR] [Telegram] {fund_name} 推送异常: {e}")
+
+    def start_stream(self, fund_name, edit_interval=3.0):
+        """
+        创建一个流式推送会话，配合 LLMService.generate_report_stream 使用
+        """
+        return TelegramReportStream(self, fund_name, edit_interval)
+
+    def _call(self, method, payload):
+        """
+        调用 Bot API，遇到 429 时按 retry_after 等待后重试一次
+
+        Returns:
+            dict | None: 成功时返回 result 字段，失败(含网络异常)返回 None
+        """
+        url = f"https://api.telegram.org/bot{self.token}/{method}"
+        for attempt in range(2):
+            try:
+                resp = requests.post(url, json=payload, timeout=10)
+            except Exception as e:
+                print(f"  [ERROR] [Telegram] {method} 异常: {e}")
+                return None
+            if resp.status_code == 200:
+                return resp.json().get("result")
+            if resp.status_code == 429 and attempt == 0:
+                retry_after = resp.json().get("parameters", {}).get("retry_after", 1)
+                print(f"  [WARN] [Telegram] 触发限流，{retry_after} 秒后重试...")
+                time.sleep(retry_after)
+                continue
+            print(f"  [ERROR] [Telegram] {method} 失败: HTTP {resp.status_code}")
+            return None
+        return None
+
+
+class TelegramReportStream:
+    """
+    章节级流式推送：首个章节完成即发送消息，后续章节通过编辑追加到同一条消息；
+    超出 4096 字符上限时另起一条新消息继续追加。
+    未成功送达的内容始终保留在 pending 中，下次刷新或 finish() 时重试
+    """
+
+    MAX_LEN = 4096
+    TRUNCATED_NOTICE = "⚠️ 报告生成中断，以上内容不完整"
+
+    def __init__(self, bot, fund_name, edit_interval=3.0):
+        self.bot = bot
+        self.fund_name = fund_name
+        self.edit_interval = edit_interval
+        self.enabled = bool(bot.token and bot.chat_id)
+        self.message_id = None
+        self.text = ""          # 当前消息已确认推送的内容
+        self.pending = ""       # 已到达但尚未送达的内容
+        self.last_edit = 0.0
+        self.sent_count = 0
+        if not self.enabled:
+            print(f"  [WARN] [Telegram] {fund_name} 流式推送跳过: 配置缺失")
+
+    def push(self, section):
+        if not self.enabled:
+            return
+        clean = section.replace("*", "").replace("_", "")
+        self._append(clean)
+        if self.message_id is None or time.monotonic() - self.last_edit >= self.edit_interval:
+            self._flush()
+
+    def finish(self, error=None):
+        """
+        推送剩余内容；error 非空时说明报告被截断，追加中断提示
+        """
+        if not self.enabled:
+            return
+        if error and (self.sent_count or self.pending):
+            self._append(self.TRUNCATED_NOTICE)
+        if self.pending:
+            wait = self.edit_interval - (time.monotonic() - self.last_edit)
+            if wait > 0:
+                time.sleep(wait)
+            self._flush()
+        if self.pending:
+            # 编辑仍失败时最后尝试一次以新消息发送
+            self._flush(new_message=True)
+        if self.pending:
+            print(f"  [ERROR] [Telegram] {self.fund_name} 仍有 {len(self.pending)} 字符未能送达")
+        if self.sent_count:
+            print(f"  [OK] [Telegram] {self.fund_name} 流式推送完成 ({self.sent_count} 条消息)")
+
+    def _append(self, text):
+        self.pending = f"{self.pending}\n\n{text}" if self.pending else text
+
+    def _flush(self, new_message=False):
+        if not self.pending:
+            return
+        if self.message_id is not None and not new_message:
+            combined = f"{self.text}\n\n{self.pending}"
+            if len(combined) <= self.MAX_LEN:
+                result = self.bot._call("editMessageText", {
+                    "chat_id": self.bot.chat_id,
+                    "message_id": self.message_id,
+                    "text": combined,
+                    "parse_mode": "Markdown"
+                })
+                self.last_edit = time.monotonic()
+                if result is not None:
+                    self.text = combined
+                    self.pending = ""
+                return
+        self._send_chunks()
+
+    def _send_chunks(self):
+        """
+        以新消息发送 pending，超长时按行切分成多条，最后一条作为后续编辑目标；
+        某条发送失败时停止，未发送部分留在 pending 中
+        """
+        header = "" if self.sent_count else f"📊 *{self.fund_name} 分析日报*\n\n"
+        chunks = _split_message(header + self.pending, self.MAX_LEN)
+        for idx, chunk in enumerate(chunks):
+            result = self.bot._call("sendMessage", {
+                "chat_id": self.bot.chat_id,
+                "text": chunk,
+                "parse_mode": "Markdown"
+            })
+            self.last_edit = time.monotonic()
+            if result is None:
+                if idx > 0:
+                    self.pending = "\n".join(chunks[idx:])
+                return
+            self.message_id = result.get("message_id")
+            self.text = chunk
+            self.sent_count += 1
+            print(f"  [推送] [Telegram] {self.fund_name} 已发送第 {self.sent_count} 条消息 ({len(chunk)} 字符)")
+        self.pending = ""
+
+
+def _split_message(text, limit):
+    """
+    按行把文本切分为不超过 limit 字符的若干段，单行超长时硬切
+    """
+    chunks = []
+    current = ""
+    for line in text.split("\n"):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks